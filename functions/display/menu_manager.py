@@ -10,8 +10,10 @@ Ce module contient les classes et fonctions pour gérer le menu latéral.
 import pygame
 import numpy as np
 import inspect
+from functools import partial
+from bisect import bisect_left, bisect_right
 from config.display_config import MENU_WIDTH, BLACK, WHITE, LIGHT_GRAY, RED, BLUE, GREEN, YELLOW, PURPLE
-from functions.display.ui_widgets import Button, Checkbox, Label, Panel, InfoButton, ScrollablePanel
+from functions.display.ui_widgets import Button, Checkbox, Label, Panel, InfoButton, ScrollablePanel, UIContext, to_display_format
 from functions.growth import growth_functions
 
 class KernelManager:
@@ -202,21 +204,17 @@ class MenuManager:
         # Créer les checkboxes pour chaque kernel
         self.kernel_checkboxes = []
         self.kernel_info_buttons = []
+        # Lignes du panneau défilant: (checkbox, bouton d'info, rectangle de la ligne hors défilement)
+        self.kernel_rows = []
         
         for i, (m, s, h, src, dst) in enumerate(zip(ms, ss, hs, sources, destinations)):
             name = f"K{i}: {src}->{dst} (m={m:.2f}, h={h:.2f})"
             y_pos = 70 + i * 30
             
-            # Créer une fonction d'action spécifique pour chaque indice
-            def create_action(idx):
-                def action(state):
-                    self.toggle_kernel(idx, state)
-                return action
-                
             checkbox = Checkbox(
                 30, y_pos, 20, name, self.font, 
                 checked=True,
-                action=create_action(i)
+                action=partial(self.toggle_kernel, i)
             )
             self.kernel_checkboxes.append(checkbox)
             
@@ -236,6 +234,22 @@ class MenuManager:
                 self.font, info_text, self.small_font
             )
             self.kernel_info_buttons.append(info_button)
+            self.kernel_rows.append((checkbox, info_button, checkbox.rect.union(info_button.rect)))
+        
+        # Bords des lignes, triés par construction, pour retrouver les lignes visibles par bissection
+        self._kernel_row_tops = [row_rect.top for _, _, row_rect in self.kernel_rows]
+        self._kernel_row_bottoms = [row_rect.bottom for _, _, row_rect in self.kernel_rows]
+        
+        # État affiché de chaque ligne dans la surface de contenu du panneau, et zone qu'elle y occupe
+        self._kernel_row_states = [None] * len(self.kernel_rows)
+        self._kernel_row_areas = [None] * len(self.kernel_rows)
+        # Vrai si la souris était sur le panneau des kernels à la dernière mise à jour des lignes
+        # (leur survol doit alors être effacé même si la souris l'a quitté)
+        self._kernel_hover_pending = False
+        
+        # Rendu du menu en cache et état des widgets correspondant
+        self._menu_surface = None
+        self._menu_state = None
             
         # Créer les checkboxes pour chaque fonction de croissance
         self.growth_checkboxes = []
@@ -245,16 +259,11 @@ class MenuManager:
             # La fonction gauss est cochée par défaut
             is_default = (func_name == "gauss")
             
-            def create_action(name):
-                def action(state):
-                    self.toggle_growth_function(name, state)
-                return action
-                
             checkbox = Checkbox(
                 30, y_offset + i * 30, 20, 
                 func_name, self.font, 
                 checked=is_default,
-                action=create_action(func_name)
+                action=partial(self.toggle_growth_function, func_name)
             )
             self.growth_checkboxes.append(checkbox)
             
@@ -303,46 +312,69 @@ class MenuManager:
         for checkbox in self.growth_checkboxes:
             checkbox.checked = checkbox.text == "gauss"
         
-    def draw(self, surface):
+    def _visible_kernel_range(self):
         """
-        Dessine le menu sur la surface.
+        Retourne les indices des lignes de kernels au moins partiellement visibles dans le panneau défilant.
+        
+        Returns:
+            tuple: (lo, hi) tels que kernel_rows[lo:hi] soit la tranche visible
+        """
+        vis_top, vis_bot = self.kernel_panel.get_visible_band()
+        lo = bisect_right(self._kernel_row_bottoms, vis_top)
+        hi = bisect_left(self._kernel_row_tops, vis_bot)
+        return lo, hi
+        
+    def _refresh_kernel_content(self):
+        """
+        Redessine dans la surface de contenu du panneau les lignes visibles dont l'état a changé.
+        Les lignes hors de la zone visible sont mises à jour lorsqu'elles y entrent.
+        """
+        content = self.kernel_panel.get_content_surface()
+        offset_x, offset_y = -self.kernel_panel.rect.left, -self.kernel_panel.rect.top
+        
+        lo, hi = self._visible_kernel_range()
+        for i, (checkbox, info_button, _) in enumerate(self.kernel_rows[lo:hi], lo):
+            state = (checkbox.checked, checkbox.hovered, info_button.hovered)
+            if state == self._kernel_row_states[i]:
+                continue
+            
+            # Effacer l'ancien rendu de la ligne puis la redessiner
+            if self._kernel_row_areas[i] is not None:
+                content.fill(self.kernel_panel.color, self._kernel_row_areas[i])
+            rects = content.blits(
+                checkbox.get_blits(offset_x, offset_y) + info_button.get_blits(offset_x, offset_y)
+            )
+            self._kernel_row_areas[i] = rects[0].unionall(rects[1:])
+            self._kernel_row_states[i] = state
+        
+    def _get_menu_state(self):
+        """
+        Retourne l'état visible des widgets du menu, pour savoir si son rendu en cache est à jour.
+        
+        Returns:
+            tuple: Défilement et états (coché, survolé) de tous les widgets interactifs
+        """
+        return (
+            self.kernel_panel.scroll_y,
+            [(checkbox.checked, checkbox.hovered, info_button.hovered)
+             for checkbox, info_button, _ in self.kernel_rows],
+            [(checkbox.checked, checkbox.hovered) for checkbox in self.growth_checkboxes],
+            self.reset_button.hovered
+        )
+        
+    def _draw_widgets(self, surface):
+        """
+        Dessine les widgets du menu (sans les popups) sur la surface.
         
         Args:
-            surface (pygame.Surface): Surface sur laquelle dessiner le menu
+            surface (pygame.Surface): Surface sur laquelle dessiner les widgets
         """
         # Titre principal
         self.kernels_title.draw(surface)
         
-        # Panneau des kernels
+        # Panneau des kernels, avec ses lignes pré-composées
+        self._refresh_kernel_content()
         self.kernel_panel.draw(surface)
-        content_rect = self.kernel_panel.get_content_rect()
-        
-        # Dessiner les checkboxes et boutons d'info des kernels
-        for i, (checkbox, info_button) in enumerate(zip(self.kernel_checkboxes, self.kernel_info_buttons)):
-            y_pos = 70 + i * 30
-            
-            # Vérifier si l'élément est visible dans le panneau défilant
-            if self.kernel_panel.is_visible(y_pos):
-                # Ajuster la position pour le défilement
-                adjusted_y = y_pos - self.kernel_panel.scroll_y
-                
-                # Créer des copies temporaires des widgets à la position ajustée
-                temp_checkbox = Checkbox(
-                    checkbox.rect.x, adjusted_y, 
-                    checkbox.size, checkbox.text, 
-                    checkbox.font, checkbox.checked
-                )
-                temp_checkbox.draw(surface)
-                
-                temp_info_button = InfoButton(
-                    info_button.rect.x, adjusted_y, 
-                    info_button.rect.width, 
-                    info_button.font, 
-                    info_button.popup_content, 
-                    info_button.popup_font
-                )
-                temp_info_button.popup_visible = info_button.popup_visible
-                temp_info_button.draw(surface)
         
         # Titre des fonctions de croissance
         self.growth_title.draw(surface)
@@ -357,6 +389,35 @@ class MenuManager:
         # Dessiner le bouton de réinitialisation
         self.reset_button.draw(surface)
         
+    def draw(self, surface):
+        """
+        Dessine le menu sur la surface.
+        Le menu est rendu dans une surface en cache, redessinée uniquement quand l'état d'un widget change.
+        
+        Args:
+            surface (pygame.Surface): Surface sur laquelle dessiner le menu
+        """
+        if self._menu_surface is None:
+            self._menu_surface = to_display_format(pygame.Surface((MENU_WIDTH, surface.get_height())))
+        
+        state = self._get_menu_state()
+        if state != self._menu_state:
+            self._menu_surface.fill(WHITE)
+            self._draw_widgets(self._menu_surface)
+            self._menu_state = state
+        surface.blit(self._menu_surface, (0, 0))
+        
+        # Dessiner les popups ouverts par-dessus le menu (ils peuvent déborder sur la simulation),
+        # à la position ajustée au défilement
+        offset_y = -self.kernel_panel.scroll_y
+        lo, hi = self._visible_kernel_range()
+        for _, info_button, _ in self.kernel_rows[lo:hi]:
+            if info_button.popup_visible:
+                original_rect = info_button.rect.copy()
+                info_button.rect.y += offset_y
+                info_button.draw_popup(surface)
+                info_button.rect = original_rect
+        
     def update(self, event_list):
         """
         Met à jour l'état du menu en fonction des événements.
@@ -364,34 +425,35 @@ class MenuManager:
         Args:
             event_list (list): Liste des événements pygame
         """
-        # Mettre à jour le panneau défilant
-        self.kernel_panel.update(event_list)
+        # Position de la souris et événements filtrés, partagés par tous les widgets
+        ctx = UIContext(event_list)
         
-        # Mettre à jour les checkboxes et boutons d'info des kernels
-        for i, (checkbox, info_button) in enumerate(zip(self.kernel_checkboxes, self.kernel_info_buttons)):
-            y_pos = 70 + i * 30
-            
-            # Vérifier si l'élément est visible et ajuster sa position
-            if self.kernel_panel.is_visible(y_pos):
-                adjusted_y = y_pos - self.kernel_panel.scroll_y
-                
-                # Déplacer temporairement les widgets pour l'interaction
-                original_rect = checkbox.rect.copy()
-                checkbox.rect.y = adjusted_y
-                checkbox.update(event_list)
-                checkbox.rect = original_rect
-                
-                original_rect = info_button.rect.copy()
-                info_button.rect.y = adjusted_y
-                info_button.update(event_list)
-                info_button.rect = original_rect
+        # Sans événement souris, ni le survol ni les clics ne peuvent changer
+        if not ctx.mouse_events:
+            return
+        
+        # Mettre à jour le panneau défilant
+        self.kernel_panel.update(ctx)
+        
+        # Mettre à jour les checkboxes et boutons d'info des kernels, décalés du défilement.
+        # Les lignes sont découpées au panneau: hors de celui-ci, elles ne peuvent être ni survolées
+        # ni cliquées, mais reçoivent quand même les clics pour fermer leurs popups.
+        # Souris hors du panneau et sans clic: rien ne peut changer, sauf un survol à effacer
+        over_kernels = self.kernel_panel.rect.collidepoint(ctx.mouse_pos)
+        if over_kernels or ctx.clicks or self._kernel_hover_pending:
+            offset_y = -self.kernel_panel.scroll_y
+            lo, hi = self._visible_kernel_range()
+            for checkbox, info_button, _ in self.kernel_rows[lo:hi]:
+                checkbox.update(ctx, offset_y, over_kernels)
+                info_button.update(ctx, offset_y, over_kernels)
+            self._kernel_hover_pending = over_kernels
             
         # Mettre à jour les checkboxes des fonctions de croissance
         for checkbox in self.growth_checkboxes:
-            checkbox.update(event_list)
+            checkbox.update(ctx)
             
         # Mettre à jour le bouton de réinitialisation
-        self.reset_button.update(event_list)
+        self.reset_button.update(ctx)
         
     def get_active_kernel_indices(self):
         """
@@ -8,11 +8,109 @@ Ce module contient les classes et fonctions pour créer l'interface utilisateur
 """
 
 import pygame
+from functools import lru_cache
 from config.display_config import (
     BLACK, WHITE, GRAY, LIGHT_GRAY, DARK_GRAY, BLUE, GREEN, 
     POPUP_PADDING, POPUP_BACKGROUND, POPUP_BORDER, POPUP_BORDER_WIDTH
 )
 
+def to_display_format(surface):
+    """
+    Convertit une surface au format de pixels de l'écran, pour que ses blits évitent
+    toute conversion. Sans fenêtre ouverte, la surface est retournée telle quelle.
+    
+    Args:
+        surface (pygame.Surface): Surface à convertir
+        
+    Returns:
+        pygame.Surface: Surface au format de l'écran
+    """
+    if pygame.display.get_surface() is None:
+        return surface
+    if surface.get_flags() & pygame.SRCALPHA:
+        return surface.convert_alpha()
+    return surface.convert()
+
+@lru_cache(maxsize=4096)
+def render_text(font, text, color=BLACK):
+    """
+    Rend un texte avec antialiasing, en partageant le résultat entre tous les widgets.
+    
+    Args:
+        font (pygame.font.Font): Police à utiliser
+        text (str): Texte à rendre
+        color (tuple, optional): Couleur du texte
+        
+    Returns:
+        pygame.Surface: Surface contenant le texte rendu (à ne pas modifier)
+    """
+    return to_display_format(font.render(text, True, color))
+
+@lru_cache(maxsize=4096)
+def text_size(font, text):
+    """
+    Mesure un texte, en partageant le résultat entre tous les widgets.
+    
+    Args:
+        font (pygame.font.Font): Police à utiliser
+        text (str): Texte à mesurer
+        
+    Returns:
+        tuple: (largeur, hauteur) du texte rendu
+    """
+    return font.size(text)
+
+@lru_cache(maxsize=64)
+def render_box(size, color, border_color, border_width=2, inner_rect=None, inner_color=None):
+    """
+    Rend le fond et la bordure d'un widget, en partageant le résultat entre tous les widgets.
+    
+    Args:
+        size (tuple): Dimensions (largeur, hauteur) de la boîte
+        color (tuple): Couleur de fond
+        border_color (tuple): Couleur de la bordure
+        border_width (int, optional): Épaisseur de la bordure
+        inner_rect (tuple, optional): Rectangle intérieur (x, y, largeur, hauteur) relatif à la boîte
+        inner_color (tuple, optional): Couleur du rectangle intérieur
+        
+    Returns:
+        pygame.Surface: Surface opaque contenant la boîte rendue (à ne pas modifier)
+    """
+    box = to_display_format(pygame.Surface(size))
+    box_rect = box.get_rect()
+    pygame.draw.rect(box, color, box_rect)
+    pygame.draw.rect(box, border_color, box_rect, border_width)
+    if inner_rect is not None:
+        pygame.draw.rect(box, inner_color, inner_rect)
+    return box
+
+# Types d'événements souris pris en compte par les widgets
+MOUSE_EVENT_TYPES = frozenset((
+    pygame.MOUSEWHEEL, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION
+))
+
+class UIContext:
+    """
+    Contexte d'une frame partagé par tous les widgets.
+    La position de la souris est lue et les événements sont filtrés une seule fois par frame.
+    """
+    
+    def __init__(self, event_list):
+        """
+        Initialise le contexte de la frame.
+        
+        Args:
+            event_list (list): Liste des événements pygame de la frame
+        """
+        self.mouse_pos = pygame.mouse.get_pos()
+        # Événements souris, dans leur ordre d'arrivée
+        self.mouse_events = [event for event in event_list if event.type in MOUSE_EVENT_TYPES]
+        # Clics gauches
+        self.clicks = [
+            event for event in self.mouse_events
+            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1
+        ]
+
 class Button:
     """Un bouton cliquable pour l'interface utilisateur."""
     
@@ -35,31 +133,71 @@ class Button:
         self.action = action
         self.hovered = False
         
-    def draw(self, surface):
-        """Dessine le bouton sur la surface."""
+        # Bornes entières du rectangle, pour un test de survol sans appel à collidepoint
+        # (le rectangle est fixe après construction)
+        self._bounds = (self.rect.left, self.rect.top, self.rect.right, self.rect.bottom)
+        
+        # Cache du texte rendu et de son décalage de centrage dans le bouton
+        self._text_surf = None
+        self._text_key = None
+        self._text_offset = (0, 0)
+        
+    def _update_text_cache(self):
+        """Re-rend le texte uniquement si le texte ou la police ont changé."""
+        key = (self.text, self.font)
+        if key != self._text_key:
+            self._text_surf = render_text(self.font, self.text)
+            text_width, text_height = self._text_surf.get_size()
+            self._text_offset = (
+                self.rect.width // 2 - text_width // 2,
+                self.rect.height // 2 - text_height // 2
+            )
+            self._text_key = key
+        
+    def get_blits(self, offset_x=0, offset_y=0):
+        """
+        Retourne les surfaces à dessiner pour le bouton, prêtes pour surface.blits.
+        
+        Args:
+            offset_x (int, optional): Décalage horizontal à appliquer
+            offset_y (int, optional): Décalage vertical à appliquer (défilement)
+            
+        Returns:
+            list: Couples (surface, position) du fond et du texte
+        """
         color = LIGHT_GRAY if self.hovered else GRAY
         border_color = BLUE if self.hovered else DARK_GRAY
+        self._update_text_cache()
+        x, y = self.rect.x + offset_x, self.rect.y + offset_y
+        return [
+            (render_box(self.rect.size, color, border_color), (x, y)),
+            (self._text_surf, (x + self._text_offset[0], y + self._text_offset[1]))
+        ]
         
-        # Dessiner le fond du bouton
-        pygame.draw.rect(surface, color, self.rect)
-        # Dessiner le bord du bouton
-        pygame.draw.rect(surface, border_color, self.rect, 2)
-        
-        # Dessiner le texte
-        text_surf = self.font.render(self.text, True, BLACK)
-        text_rect = text_surf.get_rect(center=self.rect.center)
-        surface.blit(text_surf, text_rect)
+    def draw(self, surface):
+        """Dessine le bouton sur la surface."""
+        surface.blits(self.get_blits(), doreturn=False)
         
-    def update(self, event_list):
-        """Met à jour l'état du bouton en fonction des événements."""
-        mouse_pos = pygame.mouse.get_pos()
-        self.hovered = self.rect.collidepoint(mouse_pos)
+    def update(self, ctx, offset_y=0, visible=True):
+        """
+        Met à jour l'état du bouton en fonction des événements.
         
-        for event in event_list:
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 and self.hovered:
-                if self.action:
-                    self.action()
-                return True
+        Args:
+            ctx (UIContext): Contexte de la frame (position de la souris, événements)
+            offset_y (int, optional): Décalage vertical du widget à l'écran (défilement)
+            visible (bool, optional): Faux si la souris est hors de la zone où le widget est affiché
+                (panneau défilant): le widget ne peut alors être ni survolé ni cliqué
+        """
+        mx, my = ctx.mouse_pos
+        left, top, right, bottom = self._bounds
+        my -= offset_y
+        self.hovered = visible and left <= mx < right and top <= my < bottom
+        
+        # Seul un clic sur le bouton peut avoir un effet
+        if self.hovered and ctx.clicks:
+            if self.action:
+                self.action()
+            return True
         return False
 
 class InfoButton(Button):
@@ -82,54 +220,117 @@ class InfoButton(Button):
         self.popup_font = popup_font
         self.popup_visible = False
         
+        # Cache de la mise en page du popup (lignes rendues, décalages et dimensions)
+        self._popup_key = None
+        self._popup_line_surfs = []
+        self._popup_line_offsets = []
+        self._popup_size = (0, 0)
+        
+        # Cache de la position du popup à l'écran
+        self._popup_rect = None
+        self._popup_rect_key = None
+        
     def toggle_popup(self):
         """Affiche ou masque le popup."""
         self.popup_visible = not self.popup_visible
         
-    def draw(self, surface):
-        """Dessine le bouton et éventuellement le popup."""
-        # Dessiner le bouton
-        super().draw(surface)
+    def _update_popup_cache(self):
+        """Recalcule la mise en page du popup uniquement si son contenu ou sa police ont changé."""
+        key = (self.popup_content, self.popup_font)
+        if key == self._popup_key:
+            return
+        
+        lines = self.popup_content.split('\n')
+        sizes = [text_size(self.popup_font, line) for line in lines]
+        self._popup_line_surfs = [render_text(self.popup_font, line) for line in lines]
+        
+        # Décalage vertical de chaque ligne par rapport au bord supérieur du popup
+        self._popup_line_offsets = []
+        y_offset = POPUP_PADDING
+        for _, line_height in sizes:
+            self._popup_line_offsets.append(y_offset)
+            y_offset += line_height
+        
+        self._popup_size = (
+            max(line_width for line_width, _ in sizes) + 2 * POPUP_PADDING,
+            sum(line_height for _, line_height in sizes) + 2 * POPUP_PADDING
+        )
+        self._popup_key = key
         
-        # Dessiner le popup si visible
-        if self.popup_visible:
-            # Calculer les dimensions du popup
-            lines = self.popup_content.split('\n')
-            width = max(self.popup_font.size(line)[0] for line in lines) + 2 * POPUP_PADDING
-            height = sum(self.popup_font.size(line)[1] for line in lines) + 2 * POPUP_PADDING
+    def _get_popup_rect(self, screen_size):
+        """
+        Retourne le rectangle du popup, recalculé uniquement si le bouton,
+        la taille de l'écran ou les dimensions du popup ont changé.
+        
+        Args:
+            screen_size (tuple): Dimensions (largeur, hauteur) de la surface cible
+            
+        Returns:
+            pygame.Rect: Rectangle du popup
+        """
+        key = (self.rect.right, self.rect.top, screen_size, self._popup_size)
+        if key != self._popup_rect_key:
+            width, height = self._popup_size
+            screen_width, screen_height = screen_size
             
             # Assurer qu'il reste dans les limites de l'écran
-            screen_width, screen_height = surface.get_size()
             x = min(self.rect.right + 5, screen_width - width - 5)
             y = min(self.rect.top, screen_height - height - 5)
-            
-            # Créer le rectangle du popup
-            popup_rect = pygame.Rect(x, y, width, height)
-            
-            # Dessiner le fond
-            pygame.draw.rect(surface, POPUP_BACKGROUND, popup_rect)
-            pygame.draw.rect(surface, POPUP_BORDER, popup_rect, POPUP_BORDER_WIDTH)
-            
-            # Dessiner le texte
-            y_offset = y + POPUP_PADDING
-            for line in lines:
-                text_surf = self.popup_font.render(line, True, BLACK)
-                surface.blit(text_surf, (x + POPUP_PADDING, y_offset))
-                y_offset += self.popup_font.size(line)[1]
+            self._popup_rect = pygame.Rect(x, y, width, height)
+            self._popup_rect_key = key
+        return self._popup_rect
+        
+    def draw_popup(self, surface):
+        """Dessine le popup s'il est visible."""
+        if not self.popup_visible:
+            return
+        
+        # Dimensions du popup (mises en cache)
+        self._update_popup_cache()
+        popup_rect = self._get_popup_rect(surface.get_size())
+        x, y = popup_rect.topleft
+        
+        # Dessiner le fond
+        pygame.draw.rect(surface, POPUP_BACKGROUND, popup_rect)
+        pygame.draw.rect(surface, POPUP_BORDER, popup_rect, POPUP_BORDER_WIDTH)
+        
+        # Dessiner toutes les lignes de texte en un seul appel
+        text_x = x + POPUP_PADDING
+        surface.blits(
+            [(text_surf, (text_x, y + y_offset))
+             for text_surf, y_offset in zip(self._popup_line_surfs, self._popup_line_offsets)],
+            doreturn=False
+        )
+        
+    def draw(self, surface):
+        """Dessine le bouton et éventuellement le popup."""
+        super().draw(surface)
+        self.draw_popup(surface)
     
-    def update(self, event_list):
-        """Met à jour l'état du bouton et du popup."""
-        mouse_pos = pygame.mouse.get_pos()
-        self.hovered = self.rect.collidepoint(mouse_pos)
+    def update(self, ctx, offset_y=0, visible=True):
+        """
+        Met à jour l'état du bouton et du popup.
         
-        for event in event_list:
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                if self.hovered:
-                    self.toggle_popup()
-                    return True
-                elif self.popup_visible and not self.rect.collidepoint(mouse_pos):
-                    # Fermer le popup si on clique ailleurs
-                    self.popup_visible = False
+        Args:
+            ctx (UIContext): Contexte de la frame (position de la souris, événements)
+            offset_y (int, optional): Décalage vertical du widget à l'écran (défilement)
+            visible (bool, optional): Faux si la souris est hors de la zone où le widget est affiché
+                (panneau défilant): le widget ne peut alors être ni survolé ni cliqué
+        """
+        mx, my = ctx.mouse_pos
+        left, top, right, bottom = self._bounds
+        my -= offset_y
+        self.hovered = visible and left <= mx < right and top <= my < bottom
+        
+        if not ctx.clicks:
+            return False
+        
+        if self.hovered:
+            self.toggle_popup()
+            return True
+        
+        # Fermer le popup si on clique ailleurs
+        self.popup_visible = False
         return False
 
 class Checkbox:
@@ -156,42 +357,79 @@ class Checkbox:
         self.hovered = False
         self.size = size
         
-    def draw(self, surface):
-        """Dessine la case à cocher sur la surface."""
-        border_color = BLUE if self.hovered else DARK_GRAY
+        # Bornes entières du rectangle, pour un test de survol sans appel à collidepoint
+        # (le rectangle est fixe après construction)
+        self._bounds = (self.rect.left, self.rect.top, self.rect.right, self.rect.bottom)
+        
+        # Géométrie de la coche (60% de la case, centrée), relative au coin de la case
+        check_offset = int(size * 0.2)
+        check_size = int(size * 0.6)
+        self._check_rect = (check_offset, check_offset, check_size, check_size)
+        
+        # Cache du texte rendu et de son décalage par rapport à la case
+        self._text_surf = None
+        self._text_key = None
+        self._text_offset = (0, 0)
+        
+    def _update_text_cache(self):
+        """Re-rend le texte uniquement si le texte ou la police ont changé."""
+        key = (self.text, self.font)
+        if key != self._text_key:
+            self._text_surf = render_text(self.font, self.text)
+            self._text_offset = (self.size + 10, self.size // 2 - self._text_surf.get_height() // 2)
+            self._text_key = key
+        
+    def get_blits(self, offset_x=0, offset_y=0):
+        """
+        Retourne les surfaces à dessiner pour la case, prêtes pour surface.blits.
         
-        # Dessiner la case
-        pygame.draw.rect(surface, WHITE, self.rect)
-        pygame.draw.rect(surface, border_color, self.rect, 2)
+        Args:
+            offset_x (int, optional): Décalage horizontal à appliquer
+            offset_y (int, optional): Décalage vertical à appliquer (défilement)
+            
+        Returns:
+            list: Couples (surface, position) de la case et du texte
+        """
+        border_color = BLUE if self.hovered else DARK_GRAY
         
-        # Dessiner la coche si cochée
+        # Case et coche si cochée (boîte pré-rendue)
         if self.checked:
-            inner_rect = pygame.Rect(
-                self.rect.x + self.size * 0.2,
-                self.rect.y + self.size * 0.2,
-                self.size * 0.6,
-                self.size * 0.6
-            )
-            pygame.draw.rect(surface, GREEN, inner_rect)
+            box = render_box(self.rect.size, WHITE, border_color, 2, self._check_rect, GREEN)
+        else:
+            box = render_box(self.rect.size, WHITE, border_color)
         
-        # Dessiner le texte
-        text_surf = self.font.render(self.text, True, BLACK)
-        text_rect = text_surf.get_rect(
-            midleft=(self.rect.right + 10, self.rect.centery)
-        )
-        surface.blit(text_surf, text_rect)
+        self._update_text_cache()
+        x, y = self.rect.x + offset_x, self.rect.y + offset_y
+        return [
+            (box, (x, y)),
+            (self._text_surf, (x + self._text_offset[0], y + self._text_offset[1]))
+        ]
         
-    def update(self, event_list):
-        """Met à jour l'état de la case à cocher en fonction des événements."""
-        mouse_pos = pygame.mouse.get_pos()
-        self.hovered = self.rect.collidepoint(mouse_pos)
+    def draw(self, surface):
+        """Dessine la case à cocher sur la surface."""
+        surface.blits(self.get_blits(), doreturn=False)
         
-        for event in event_list:
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 and self.hovered:
-                self.checked = not self.checked
-                if self.action:
-                    self.action(self.checked)
-                return True
+    def update(self, ctx, offset_y=0, visible=True):
+        """
+        Met à jour l'état de la case à cocher en fonction des événements.
+        
+        Args:
+            ctx (UIContext): Contexte de la frame (position de la souris, événements)
+            offset_y (int, optional): Décalage vertical du widget à l'écran (défilement)
+            visible (bool, optional): Faux si la souris est hors de la zone où le widget est affiché
+                (panneau défilant): le widget ne peut alors être ni survolé ni cliqué
+        """
+        mx, my = ctx.mouse_pos
+        left, top, right, bottom = self._bounds
+        my -= offset_y
+        self.hovered = visible and left <= mx < right and top <= my < bottom
+        
+        # Seul un clic sur la case peut avoir un effet
+        if self.hovered and ctx.clicks:
+            self.checked = not self.checked
+            if self.action:
+                self.action(self.checked)
+            return True
         return False
 
 class Label:
@@ -213,10 +451,23 @@ class Label:
         self.font = font
         self.color = color
         
+        # Le texte est rendu une seule fois, à la construction
+        self._text_surf = render_text(font, text, color)
+        
+    def set_text(self, text):
+        """
+        Change le texte du label, en le re-rendant uniquement s'il a changé.
+        
+        Args:
+            text (str): Nouveau texte à afficher
+        """
+        if text != self.text:
+            self.text = text
+            self._text_surf = render_text(self.font, text, self.color)
+        
     def draw(self, surface):
         """Dessine le label sur la surface."""
-        text_surf = self.font.render(self.text, True, self.color)
-        surface.blit(text_surf, self.pos)
+        surface.blit(self._text_surf, self.pos)
         
 class Panel:
     """Un panneau rectangulaire pour regrouper des éléments d'interface."""
@@ -237,8 +488,7 @@ class Panel:
         
     def draw(self, surface):
         """Dessine le panneau sur la surface."""
-        pygame.draw.rect(surface, self.color, self.rect)
-        pygame.draw.rect(surface, DARK_GRAY, self.rect, 2)
+        surface.blit(render_box(self.rect.size, self.color, DARK_GRAY), self.rect)
         
 class ScrollablePanel(Panel):
     """Un panneau avec défilement pour afficher beaucoup d'éléments."""
@@ -262,13 +512,33 @@ class ScrollablePanel(Panel):
         self.scrollbar_width = 15 if self.max_scroll > 0 else 0
         self.dragging_scrollbar = False
         
-    def update(self, event_list):
-        """Met à jour l'état du panneau défilant."""
-        mouse_pos = pygame.mouse.get_pos()
+        # Cache du rectangle de la scrollbar, invalidé quand le défilement ou la géométrie change
+        self._scrollbar_rect = None
+        self._scrollbar_key = None
         
-        for event in event_list:
+        # Surface de contenu pré-composée (coordonnées relatives au panneau, sans défilement)
+        self._content_surf = None
+        
+    def update(self, ctx):
+        """
+        Met à jour l'état du panneau défilant.
+        
+        Args:
+            ctx (UIContext): Contexte de la frame (position de la souris, événements)
+        """
+        # Rien à faire si aucun événement souris n'est en attente
+        if not ctx.mouse_events:
+            return False
+        
+        mouse_pos = ctx.mouse_pos
+        over_panel = self.rect.collidepoint(mouse_pos)
+        # Position de défilement visée par le drag: elle ne dépend que de la position de la souris,
+        # commune à tous les mouvements de la frame, et n'est donc calculée qu'une fois
+        drag_scroll_y = None
+        
+        for event in ctx.mouse_events:
             # Défilement avec la molette
-            if event.type == pygame.MOUSEWHEEL and self.rect.collidepoint(mouse_pos):
+            if event.type == pygame.MOUSEWHEEL and over_panel:
                 self.scroll_y = max(0, min(self.max_scroll, self.scroll_y - event.y * 20))
                 
             # Drag and drop de la scrollbar
@@ -283,31 +553,58 @@ class ScrollablePanel(Panel):
             if event.type == pygame.MOUSEMOTION and self.dragging_scrollbar:
                 # Calcul de la nouvelle position de défilement
                 if self.max_scroll > 0:
-                    ratio = (mouse_pos[1] - self.rect.top) / self.rect.height
-                    self.scroll_y = max(0, min(self.max_scroll, int(ratio * self.content_height)))
+                    if drag_scroll_y is None:
+                        ratio = (mouse_pos[1] - self.rect.top) / self.rect.height
+                        drag_scroll_y = max(0, min(self.max_scroll, int(ratio * self.content_height)))
+                    self.scroll_y = drag_scroll_y
                     
         return False
         
     def _get_scrollbar_rect(self):
-        """Retourne le rectangle de la scrollbar."""
+        """Retourne le rectangle de la scrollbar (recalculé seulement si nécessaire)."""
+        key = (self.scroll_y, self.max_scroll, self.content_height, self.scrollbar_width, tuple(self.rect))
+        if key == self._scrollbar_key:
+            return self._scrollbar_rect
+        
         if self.max_scroll <= 0:
-            return pygame.Rect(0, 0, 0, 0)
+            self._scrollbar_rect = pygame.Rect(0, 0, 0, 0)
+        else:
+            bar_height = max(30, int(self.rect.height * (self.rect.height / self.content_height)))
+            bar_y = self.rect.top + int((self.rect.height - bar_height) * (self.scroll_y / self.max_scroll))
+            
+            self._scrollbar_rect = pygame.Rect(
+                self.rect.right - self.scrollbar_width, 
+                bar_y, 
+                self.scrollbar_width, 
+                bar_height
+            )
+        self._scrollbar_key = key
+        return self._scrollbar_rect
         
-        bar_height = max(30, int(self.rect.height * (self.rect.height / self.content_height)))
-        bar_y = self.rect.top + int((self.rect.height - bar_height) * (self.scroll_y / self.max_scroll))
+    def get_content_surface(self):
+        """
+        Retourne la surface de contenu pré-composée, créée à la première demande.
+        Le contenu y est dessiné une fois, sans défilement; seule la bande visible est affichée.
         
-        return pygame.Rect(
-            self.rect.right - self.scrollbar_width, 
-            bar_y, 
-            self.scrollbar_width, 
-            bar_height
-        )
+        Returns:
+            pygame.Surface: Surface de taille (largeur du panneau, hauteur du contenu)
+        """
+        if self._content_surf is None:
+            self._content_surf = to_display_format(pygame.Surface((self.rect.width, self.content_height)))
+            self._content_surf.fill(self.color)
+        return self._content_surf
         
     def draw(self, surface):
-        """Dessine le panneau et sa scrollbar."""
+        """Dessine le panneau, la bande visible de son contenu et sa scrollbar."""
         # Dessiner le fond
         super().draw(surface)
         
+        # Dessiner la bande visible du contenu, à l'intérieur de la bordure
+        if self._content_surf is not None:
+            inner_rect = self.rect.inflate(-4, -4)
+            area = pygame.Rect(2, 2 + self.scroll_y, inner_rect.width, inner_rect.height)
+            surface.blit(self._content_surf, inner_rect, area)
+        
         # Dessiner la scrollbar si nécessaire
         if self.max_scroll > 0:
             scrollbar_rect = self._get_scrollbar_rect()
@@ -327,6 +624,16 @@ class ScrollablePanel(Panel):
         """Vérifie si une position Y est visible dans le panneau."""
         return (self.rect.top <= y_pos - self.scroll_y <= self.rect.bottom)
         
+    def get_visible_band(self):
+        """
+        Retourne la bande verticale visible, en coordonnées du contenu (sans défilement).
+        
+        Returns:
+            tuple: (vis_top, vis_bot) bornes de la zone visible
+        """
+        vis_top = self.rect.top + self.scroll_y
+        return vis_top, vis_top + self.rect.height
+        
 class DropdownMenu:
     """Un menu déroulant pour choisir parmi plusieurs options."""
     
@@ -361,79 +668,116 @@ class DropdownMenu:
             width, len(options) * self.option_height
         )
         
+        # Cache du texte rendu des options, de leurs positions et des lignes du menu déployé
+        self._option_surfs = []
+        self._selected_positions = []
+        self._option_positions = []
+        self._option_rects = []
+        self._option_blits = []
+        self._options_key = None
+        
+        # Pré-rendre la flèche une fois pour toutes (elle ne dépend que de self.rect)
+        self._arrow_surf = to_display_format(pygame.Surface((21, 11), pygame.SRCALPHA))
+        pygame.draw.polygon(self._arrow_surf, BLACK, [(10, 0), (20, 10), (0, 10)])
+        self._arrow_pos = (self.rect.right - 30, self.rect.centery - 5)
+        
+    def _update_options_cache(self):
+        """
+        Re-rend le texte des options uniquement si les options ou la police ont changé,
+        et calcule leurs positions (centrées verticalement) dans le menu principal
+        et dans chaque ligne du menu déployé.
+        """
+        key = (tuple(self.options), self.font)
+        if key == self._options_key:
+            return
+        
+        self._option_surfs = [render_text(self.font, option) for option in self.options]
+        self._selected_positions = []
+        self._option_positions = []
+        self._option_rects = []
+        for i, text_surf in enumerate(self._option_surfs):
+            option_rect = pygame.Rect(
+                self.dropdown_rect.left,
+                self.dropdown_rect.top + i * self.option_height,
+                self.dropdown_rect.width,
+                self.option_height
+            )
+            self._option_rects.append(option_rect)
+            
+            half_height = text_surf.get_height() // 2
+            self._selected_positions.append((self.rect.left + 10, self.rect.centery - half_height))
+            self._option_positions.append((option_rect.left + 10, option_rect.centery - half_height))
+        self._option_blits = list(zip(self._option_surfs, self._option_positions))
+        self._options_key = key
+        
     def draw(self, surface):
         """Dessine le menu déroulant."""
+        self._update_options_cache()
+        
         # Dessiner le menu principal
         color = LIGHT_GRAY
         border_color = BLUE if self.is_open else DARK_GRAY
         
-        pygame.draw.rect(surface, color, self.rect)
-        pygame.draw.rect(surface, border_color, self.rect, 2)
+        surface.blit(render_box(self.rect.size, color, border_color), self.rect)
         
         # Dessiner le texte de l'option sélectionnée
         if 0 <= self.selected_index < len(self.options):
-            text = self.options[self.selected_index]
-            text_surf = self.font.render(text, True, BLACK)
-            text_rect = text_surf.get_rect(midleft=(self.rect.left + 10, self.rect.centery))
-            surface.blit(text_surf, text_rect)
+            surface.blit(self._option_surfs[self.selected_index], self._selected_positions[self.selected_index])
         
         # Dessiner la flèche
-        arrow_points = [
-            (self.rect.right - 20, self.rect.centery - 5),
-            (self.rect.right - 10, self.rect.centery + 5),
-            (self.rect.right - 30, self.rect.centery + 5)
-        ]
-        pygame.draw.polygon(surface, BLACK, arrow_points)
+        surface.blit(self._arrow_surf, self._arrow_pos)
         
         # Si le menu est ouvert, dessiner les options
         if self.is_open:
-            pygame.draw.rect(surface, WHITE, self.dropdown_rect)
-            pygame.draw.rect(surface, DARK_GRAY, self.dropdown_rect, 2)
+            surface.blit(render_box(self.dropdown_rect.size, WHITE, DARK_GRAY), self.dropdown_rect)
             
-            for i, option in enumerate(self.options):
-                option_rect = pygame.Rect(
-                    self.dropdown_rect.left,
-                    self.dropdown_rect.top + i * self.option_height,
-                    self.dropdown_rect.width,
-                    self.option_height
-                )
-                
-                # Surligner l'option survolée
-                if i == self.hovered_index:
-                    pygame.draw.rect(surface, LIGHT_GRAY, option_rect)
-                
-                text_surf = self.font.render(option, True, BLACK)
-                text_rect = text_surf.get_rect(midleft=(option_rect.left + 10, option_rect.centery))
-                surface.blit(text_surf, text_rect)
+            # Surligner l'option survolée
+            if self.hovered_index >= 0:
+                pygame.draw.rect(surface, LIGHT_GRAY, self._option_rects[self.hovered_index])
+            
+            # Dessiner le texte de toutes les options en un seul appel
+            surface.blits(self._option_blits, doreturn=False)
     
-    def update(self, event_list):
-        """Met à jour l'état du menu déroulant."""
-        mouse_pos = pygame.mouse.get_pos()
+    def update(self, ctx):
+        """
+        Met à jour l'état du menu déroulant.
+        
+        Args:
+            ctx (UIContext): Contexte de la frame (position de la souris, événements)
+        """
+        # Menu fermé (cas courant): seul un clic peut l'ouvrir, aucun survol à calculer
+        if not self.is_open and not ctx.clicks:
+            self.hovered_index = -1
+            return False
+        
+        mouse_pos = ctx.mouse_pos
+        over_header = self.rect.collidepoint(mouse_pos)
         
         # Vérifier si la souris survole une option
-        if self.is_open and self.dropdown_rect.collidepoint(mouse_pos):
+        over_options = self.is_open and self.dropdown_rect.collidepoint(mouse_pos)
+        if over_options:
+            # collidepoint garantit 0 <= dy < len(options) * option_height: pas besoin de borner
             self.hovered_index = (mouse_pos[1] - self.dropdown_rect.top) // self.option_height
-            self.hovered_index = max(0, min(self.hovered_index, len(self.options) - 1))
+            assert 0 <= self.hovered_index < len(self.options)
         else:
             self.hovered_index = -1
         
-        for event in event_list:
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                # Si on clique sur le menu principal, l'ouvrir ou le fermer
-                if self.rect.collidepoint(mouse_pos):
-                    self.is_open = not self.is_open
-                    return True
-                
-                # Si on clique sur une option, la sélectionner
-                elif self.is_open and self.dropdown_rect.collidepoint(mouse_pos):
-                    self.selected_index = self.hovered_index
-                    self.is_open = False
-                    if self.action:
-                        self.action(self.selected_index)
-                    return True
-                
-                # Si on clique ailleurs, fermer le menu
-                elif self.is_open:
-                    self.is_open = False
+        for _ in ctx.clicks:
+            # Si on clique sur le menu principal, l'ouvrir ou le fermer
+            if over_header:
+                self.is_open = not self.is_open
+                return True
+            
+            # Si on clique sur une option, la sélectionner
+            elif self.is_open and over_options:
+                self.selected_index = self.hovered_index
+                self.is_open = False
+                if self.action:
+                    self.action(self.selected_index)
+                return True
+            
+            # Si on clique ailleurs, fermer le menu
+            elif self.is_open:
+                self.is_open = False
         
         return False 
\ No newline at end of file
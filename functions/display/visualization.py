@@ -8,16 +8,14 @@ Ce module contient les fonctions pour visualiser la simulation Lenia.
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_agg import FigureCanvasAgg as FigureCanvas
 import pygame
 
-from config.display_config import DPI, width, height, screen, FPS, DEFAULT_INTERPOLATION, MENU_WIDTH, WHITE, BLACK
+from config.display_config import width, height, screen, FPS, DEFAULT_INTERPOLATION, MENU_WIDTH, WHITE, BLACK
 from data.creatures import inject_aquarium, init_grid
 from functions.display.menu_manager import MenuManager
 from config.simulation_config import kernels, ms, ss, hs, sources, destinations
 
-def produce_movie_multi(Xs, evolve, interpolation=DEFAULT_INTERPOLATION):
+def produce_movie_multi(Xs, evolve, interpolation=DEFAULT_INTERPOLATION, disp_skip=1):
     """
     Produit une animation de la simulation Lenia avec plusieurs canaux.
     
@@ -25,9 +23,18 @@ def produce_movie_multi(Xs, evolve, interpolation=DEFAULT_INTERPOLATION):
         Xs (list): Liste des grilles pour chaque canal
         evolve (function): Fonction d'évolution à utiliser
         interpolation (str, optional): Méthode d'interpolation pour l'affichage. Par défaut DEFAULT_INTERPOLATION.
+            'nearest' ou 'none' utilisent une mise à l'échelle au plus proche voisin, plus rapide.
+        disp_skip (int, optional): Nombre de pas de simulation par image affichée (entier >= 1). Par défaut 1.
+        
+    Raises:
+        ValueError: Si disp_skip n'est pas un entier supérieur ou égal à 1
     """
+    if not isinstance(disp_skip, int) or disp_skip < 1:
+        raise ValueError(f"disp_skip doit être un entier >= 1 (reçu: {disp_skip!r})")
+    
     running = True
     paused = False
+    step = 0
     clock = pygame.time.Clock()
 
     pygame.init()
@@ -42,15 +49,19 @@ def produce_movie_multi(Xs, evolve, interpolation=DEFAULT_INTERPOLATION):
     sim_width = width
     sim_height = height
     
-    # Création de la figure matplotlib pour les statistiques si nécessaire
-    figsize = (sim_width / DPI, sim_height / DPI)
-    fig, ax = plt.subplots(figsize=figsize, dpi=DPI)
+    # Tampons réutilisés à chaque frame pour convertir la simulation en image
+    frame_rgb = np.empty(Xs[0].shape + (len(Xs),), dtype=np.uint8)
+    frame_scratch = np.empty(Xs[0].shape)
     
-    canvas = FigureCanvas(fig)
-    im = ax.imshow(np.dstack(Xs), interpolation=interpolation)
+    # Surfaces persistantes au format de l'écran: la grille brute et sa version mise à l'échelle
+    grid_height, grid_width = Xs[0].shape
+    sim_surface = pygame.Surface((grid_width, grid_height)).convert()
+    scaled_surface = pygame.Surface((sim_width, sim_height)).convert()
+    
+    # Mise à l'échelle au plus proche voisin pour 'nearest'/'none' (moins coûteuse), lissée sinon
+    scale = pygame.transform.scale if interpolation in ('nearest', 'none') else pygame.transform.smoothscale
     
     # Variables pour l'affichage des informations
-    font = pygame.font.SysFont('Arial', 18)
     info_font = pygame.font.SysFont('Arial', 14)
     active_growth_funcs = ["gauss"]  # Par défaut
     info_surface = None
@@ -61,6 +72,12 @@ def produce_movie_multi(Xs, evolve, interpolation=DEFAULT_INTERPOLATION):
         event_list = []
         
         for event in pygame.event.get():
+            # Des mouvements de souris consécutifs sont redondants: seul le dernier, qui correspond
+            # à la position courante, est conservé (l'ordre avec les clics est préservé)
+            if (event.type == pygame.MOUSEMOTION and event_list
+                    and event_list[-1].type == pygame.MOUSEMOTION):
+                event_list[-1] = event
+                continue
             event_list.append(event)
             
             if event.type == pygame.QUIT:
@@ -99,14 +116,22 @@ def produce_movie_multi(Xs, evolve, interpolation=DEFAULT_INTERPOLATION):
         if not paused:
             # Évolution du système avec les kernels actifs et la fonction de croissance
             Xs = evolve(Xs, active_indices, growth_func)
+            step += 1
             
-            # Conversion de la simulation en image
-            data = np.dstack(Xs)
-            data_uint8 = (255 * np.clip(data, 0, 1)).astype(np.uint8)
+        if paused:
+            # En pause, cadencer la boucle pour ne pas scruter les événements en continu
+            clock.tick(FPS)
+        elif step % disp_skip == 0:
+            # L'affichage n'a lieu qu'un pas de simulation sur disp_skip (les événements sont traités à chaque pas)
+            # Conversion de la simulation en image, canal par canal, dans les tampons préalloués
+            for c, X in enumerate(Xs):
+                np.clip(X, 0, 1, out=frame_scratch)
+                frame_scratch *= 255
+                frame_rgb[..., c] = frame_scratch
             
-            # Création d'une surface pygame pour la simulation
-            surface = pygame.surfarray.make_surface(data_uint8.swapaxes(0, 1))
-            scaled_surface = pygame.transform.smoothscale(surface, (sim_width, sim_height))
+            # Copie de l'image dans la surface de la simulation, puis mise à l'échelle sur place
+            pygame.surfarray.blit_array(sim_surface, frame_rgb.swapaxes(0, 1))
+            scale(sim_surface, (sim_width, sim_height), scaled_surface)
 
             # Effacer l'écran
             screen.fill(WHITE)
@@ -138,6 +163,7 @@ def plot_growth_functions(ms, ss, hs):
         ss (list): Liste des écarts-types
         hs (list): Liste des hauteurs
     """
+    import matplotlib.pyplot as plt
     from functions.growth.growth_functions import gauss
     
     plt.figure(figsize=(10, 10))
@@ -110,15 +110,13 @@ def evolve_multi_channels_interactions(Xs, active_indices=None, growth_func=None
         # Application de l'activation au canal de destination
         Gs[destination] += h * A
     
-    # Ajout d'un terme d'interaction entre les canaux
+    # Ajout d'un terme d'interaction entre les canaux, accumulé directement dans Gs[i]
+    # (pas de grille intermédiaire par canal)
     for i in range(len(Xs)):
-        interaction_term = np.zeros_like(Xs[i])
         for j in range(len(Xs)):
             if i != j:
                 # L'influence de Xs[j] sur le canal i est pondérée par le coefficient de la matrice
-                interaction_term += interaction_matrix[i, j] * Xs[j]
-        # Ajout de ce terme d'interaction à la variation de Xs[i]
-        Gs[i] += interaction_term
+                Gs[i] += interaction_matrix[i, j] * Xs[j]
     
     # Mise à jour des canaux avec le pas de temps dt
     Xs = [np.clip(X + dt * G, 0, 1) for X, G in zip(Xs, Gs)]
@@ -29,13 +29,20 @@ def generate_kernels():
         distance = np.sqrt(x**2 + y**2) / r * len(b)
         K = np.zeros_like(distance)
         
+        # Indice d'anneau et position dans l'anneau: la grille d'échantillonnage est la même
+        # pour tous les anneaux, les profils ne sont donc évalués qu'une fois par kernel
+        ring = distance.astype(int)
+        frac = distance % 1
+        gauss_profile = gauss(frac, kernel_mu, kernel_sigma)
+        # Alternatives commentées:
+        # sinusoidal(frac, kernel_mu, kernel_sigma)
+        # soft_growth(frac, kernel_mu, kernel_sigma)
+        soft_profile = multi_peak_soft_growth(frac, kernel_mu, kernel_sigma)
+        
         for i in range(len(b)):
-            mask = (distance.astype(int) == i)
-            K += mask * b[i] * gauss(distance % 1, kernel_mu, kernel_sigma)
-            # Alternatives commentées:
-            # K += mask * b[i] * sinusoidal(distance % 1, kernel_mu, kernel_sigma)
-            # K += mask * b[i] * soft_growth(distance % 1, kernel_mu, kernel_sigma)
-            K += mask * b[i] * multi_peak_soft_growth(distance % 1, kernel_mu, kernel_sigma)
+            mask = (ring == i)
+            K += mask * b[i] * gauss_profile
+            K += mask * b[i] * soft_profile
         
         # Normalisation du kernel
         Ks.append(K / np.sum(K))